@@ -10,18 +10,39 @@ This script:
 For automated runs (non-interactive), cleanup prompts are skipped.
 """
 
+import argparse
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import zipfile
 import subprocess
 import shutil
+import fnmatch
+import hashlib
+import importlib.metadata
 import io
+import json
+import os
 from pathlib import Path
-from datetime import datetime
+from datetime import datetime, timezone
+from email.message import Message
 import sys
-import xml.etree.ElementTree as ET
+import threading
+import uuid
 import html
 import re
-from collections import defaultdict
+import struct
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache
+
+try:
+    from lxml import etree as ET
+    LXML_AVAILABLE = True
+except ImportError:
+    import xml.etree.ElementTree as ET
+    LXML_AVAILABLE = False
 
 try:
     from PIL import Image
@@ -38,22 +59,49 @@ LIBRARY_DIR = SCRIPT_DIR.parent.parent / "library"
 COMPOSITES_DIR = SCRIPT_DIR.parent.parent / "composites"
 EXTRAS_DIR = SCRIPT_DIR.parent.parent / "extras"
 DAT_DIR = SCRIPT_DIR.parent / "dat"
+DOWNLOAD_CACHE_PATH = SCRIPT_DIR.parent / ".redump-cache.json"
+FILTER_CACHE_PATH = SCRIPT_DIR.parent / ".filter-cache.json"
+PIPELINE_STATE_PATH = SCRIPT_DIR.parent / ".pipeline-state.json"
+DIMENSION_CACHE_PATH = SCRIPT_DIR.parent / ".dimension-cache.json"
+DAT_PARSE_CACHE_PATH = SCRIPT_DIR.parent / ".dat-parse-cache.json"
 REPORTS_DIR = SCRIPT_DIR.parent / "reports"
 RETOOL_DIR = SCRIPT_DIR.parent.parent / "tooling" / "retool"
 USER_CONFIG_SOURCE = SCRIPT_DIR.parent / "configs" / "user-config.yaml"
 RETOOL_CONFIG_DIR = RETOOL_DIR / "config"
 RETOOL_CONFIG_DEST = RETOOL_CONFIG_DIR / "user-config.yaml"
+# Clone lists and metadata downloaded by retool.py --update; they change Retool's output
+RETOOL_CLONE_LIST_DIRS = [RETOOL_DIR / "clonelists", RETOOL_DIR / "metadata"]
 RETOOL_REPO_URL = "https://github.com/unexpectedpanda/retool.git"
 COMPLETION_MD_PATH = SCRIPT_DIR.parent.parent / "COMPLETION.md"
 README_MD_PATH = SCRIPT_DIR.parent.parent / "README.md"
 README_MD_PATH = SCRIPT_DIR.parent.parent / "README.md"
 
+# README progress bar badges (2D, 3D and Disc), matched with flexible whitespace
+PROGRESS_BAR_PATTERN = re.compile(r'<img src="https://progress-bar\.xyz/\d+/\?title=(2D|3D|Disc)&style=for-the-badge&width=100"\s*/>')
+
+# Download settings
+DOWNLOAD_CHUNK_SIZE = 1 << 16
+RANGED_DOWNLOAD_PARTS = 4
+RANGED_DOWNLOAD_MIN_SIZE = 4 * 1024 * 1024
+
+# An interrupted run older than this starts over, since Redump may have published a newer DAT
+PIPELINE_STATE_MAX_AGE_HOURS = 12
+
+# Read/write size when copying the .dat out of the downloaded .zip
+EXTRACT_CHUNK_SIZE = 1 << 20
+
 # Retool filter settings
 RETOOL_FLAGS = ["-l", "--report"]
 
 # "AabBcDdefkMmoPpruv" taken from the filename when using the gui version of Retool
 RETOOL_EXCLUDE = ["A", "a", "b", "B", "c", "D", "d", "e", "f", "k", "M", "m", "o", "P", "p", "r", "u", "v"]
 
+# Fail fast instead of waiting on a credential prompt
+GIT_NON_INTERACTIVE_ENV = {**os.environ, "GIT_TERMINAL_PROMPT": "0", "GIT_ASKPASS": ""}
+
+# Keep pip from prompting or drawing its progress UI
+PIP_QUIET_FLAGS = ["--quiet", "--disable-pip-version-check", "--no-input"]
+
 # Retool dependencies
 RETOOL_DEPENDENCIES = [
     "alive-progress",
@@ -65,6 +113,57 @@ RETOOL_DEPENDENCIES = [
     "validators"
 ]
 
+# Retool filter report section headers and the removal reason each one maps to
+FILTER_REPORT_SECTIONS = {
+    "TITLES WITH CLONES": "Clone",
+    "APPLICATION REMOVES": "Application",
+    "AUDIO REMOVES": "Audio",
+    "COVERDISC REMOVES": "Coverdisc",
+    "DEMO, KIOSK, AND SAMPLE REMOVES": "Demo/Kiosk/Sample",
+    "EDUCATIONAL REMOVES": "Educational",
+    "UNLICENSED REMOVES": "Unlicensed",
+    "VIDEO REMOVES": "Video",
+    "LANGUAGE REMOVES": "Language",
+}
+
+# Banner, separator and preamble lines that carry no game entries
+FILTER_REPORT_SKIP_PREFIXES = ("=", "*", "SECTIONS", "This file")
+
+# (emoji, display name) for each category in the dimension analysis
+CATEGORY_DISPLAY = {
+    "2dbox": ("📦", "2DBox"),
+    "3dbox": ("📦", "3DBox"),
+    "disc": ("💿", "Disc"),
+    "psp-icon0": ("🎮", "PSP-Icon0"),
+}
+
+# 'Perfect' (width, height) standards per category
+PERFECT_DIMENSIONS = {
+    "2dbox": frozenset({(1200, 1200)}),
+    "3dbox": frozenset({(1325, 1200), (1227, 1200), (1273, 1200)}),
+    "disc": frozenset({(696, 694)}),
+}
+
+# Dimension row emoji keyed by (is_perfect, is_square)
+DIMENSION_EMOJI = {
+    (True, True): "⭐",
+    (True, False): "⭐",
+    (False, True): "🟦",
+    (False, False): "⚪",
+}
+
+# Emoji shown next to each removal reason in the report
+REASON_EMOJI = {
+    "Language": "🌐",
+    "Demo/Kiosk/Sample": "🎮",
+    "Application": "💾",
+    "Audio": "🎵",
+    "Coverdisc": "📰",
+    "Educational": "📚",
+    "Unlicensed": "⚠️",
+    "Video": "🎬",
+}
+
 # Collection directories
 COLLECTION_DIRS = {
     "2dbox": [
@@ -87,8 +186,38 @@ COLLECTION_DIRS = {
     ],
 }
 
+# Location label for each entry of COLLECTION_DIRS
+COLLECTION_LOCATIONS = {
+    "2dbox": ["normal", "lq", "missing"],
+    "3dbox": ["normal", "lq", "missing"],
+    "disc": ["normal", "lq", "missing"],
+    "psp-icon0": ["psp-icon0"],
+}
+
+# (directory, location) pairs per category, in lookup priority order
+CATEGORY_DIRS = {
+    category: list(zip(dirs, COLLECTION_LOCATIONS[category]))
+    for category, dirs in COLLECTION_DIRS.items()
+}
+
 PSP_ICON0_DIR = COMPOSITES_DIR / "psp-icon0"
 
+# Collection directories as shown in the report, relative to the workspace root
+DIR_DISPLAY = {
+    directory: str(directory.relative_to(SCRIPT_DIR.parent.parent)).replace("/", "\\") + "\\"
+    for dirs in COLLECTION_DIRS.values()
+    for directory in dirs
+}
+
+# Threads used to read image headers in analyze_image_dimensions
+IMAGE_SCAN_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# First 8 bytes of every PNG file
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+# .png directory entries (keyed by stem) per collection directory, filled on first lookup
+DIR_ENTRIES_CACHE: dict[Path, dict[str, os.DirEntry]] = {}
+
 # Check if running in non-interactive mode (e.g., GitHub Actions)
 NON_INTERACTIVE = not sys.stdin.isatty()
 
@@ -97,13 +226,14 @@ NON_INTERACTIVE = not sys.stdin.isatty()
 # DAT Download and Filtering Functions (from download-and-filter-redump-dat.py)
 # ============================================================================
 
+@lru_cache(maxsize=1)
 def check_git_available() -> bool:
-    """Check if git is available on the system."""
+    """Check if git is available on the system (probed once per run)."""
     try:
         result = subprocess.run(
             ["git", "--version"],
-            capture_output=True,
-            text=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
             check=False
         )
         return result.returncode == 0
@@ -111,9 +241,41 @@ def check_git_available() -> bool:
         return False
 
 
+def delete_trash_directory(trash_dir: Path) -> None:
+    """Delete a renamed-away directory, warning (instead of raising) if it can't be fully removed."""
+    try:
+        shutil.rmtree(trash_dir)
+    except OSError as e:
+        print(f"  ⚠️  Warning: Could not delete {trash_dir.name} (will retry next run): {e}", file=sys.stderr)
+
+
+def remove_directory_in_background(directory: Path) -> None:
+    """
+    Move a directory out of the way with a single rename, then delete it on a background thread.
+    Falls back to a synchronous rmtree if the rename fails.
+    """
+    trash_dir = directory.parent / f".{directory.name}-trash-{uuid.uuid4().hex}"
+    try:
+        os.replace(directory, trash_dir)
+    except OSError:
+        shutil.rmtree(directory)
+        return
+    
+    # Not a daemon thread, so the interpreter waits for the delete to finish before exiting
+    threading.Thread(target=delete_trash_directory, args=(trash_dir,)).start()
+
+
+def sweep_trash_directories(directory: Path) -> None:
+    """Delete, in the background, any trash left next to directory by an earlier run that failed to remove it."""
+    for trash_dir in directory.parent.glob(f".{directory.name}-trash-*"):
+        if trash_dir.is_dir():
+            threading.Thread(target=delete_trash_directory, args=(trash_dir,)).start()
+
+
 def clone_retool_if_needed(retool_dir: Path) -> bool:
     """Clone Retool repository if it doesn't exist or is not a git repository."""
     retool_script = retool_dir / "retool.py"
+    sweep_trash_directories(retool_dir)
     
     # If retool.py exists, assume Retool is already set up
     if retool_script.exists():
@@ -134,15 +296,17 @@ def clone_retool_if_needed(retool_dir: Path) -> bool:
         # Remove directory if it exists but isn't a valid Retool installation
         if retool_dir.exists() and not is_git_repo:
             print(f"  🗑️  Removing invalid Retool directory...")
-            shutil.rmtree(retool_dir)
+            remove_directory_in_background(retool_dir)
         
         # Clone Retool if directory doesn't exist or was removed
         if not retool_dir.exists():
             print(f"  📥 Cloning Retool from GitHub...")
             print(f"     Repository: {RETOOL_REPO_URL}")
             result = subprocess.run(
-                ["git", "clone", RETOOL_REPO_URL, str(retool_dir)],
-                capture_output=True,
+                ["git", "clone", "--depth=1", "--no-tags", RETOOL_REPO_URL, str(retool_dir)],
+                env=GIT_NON_INTERACTIVE_ENV,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
                 text=True,
                 check=False
             )
@@ -175,6 +339,17 @@ def copy_user_config() -> bool:
         # Ensure config directory exists
         RETOOL_CONFIG_DIR.mkdir(parents=True, exist_ok=True)
         
+        # copy2 preserves mtime, so a matching size and mtime means the last copy is still current
+        source_stat = USER_CONFIG_SOURCE.stat()
+        try:
+            dest_stat = RETOOL_CONFIG_DEST.stat()
+            if dest_stat.st_size == source_stat.st_size and dest_stat.st_mtime_ns == source_stat.st_mtime_ns:
+                print(f"  ✅ User config already up to date")
+                print(f"     Location: {RETOOL_CONFIG_DEST}")
+                return True
+        except FileNotFoundError:
+            pass
+        
         # Copy the file
         shutil.copy2(USER_CONFIG_SOURCE, RETOOL_CONFIG_DEST)
         
@@ -188,25 +363,46 @@ def copy_user_config() -> bool:
         return True  # Continue anyway - Retool will use defaults
 
 
-def install_retool_dependencies() -> bool:
-    """Install Retool dependencies."""
-    print(f"  📦 Installing {len(RETOOL_DEPENDENCIES)} package(s)...")
+def is_package_installed(package: str) -> bool:
+    """Check whether a distribution is installed without spawning pip."""
+    try:
+        importlib.metadata.version(package)
+        return True
+    except importlib.metadata.PackageNotFoundError:
+        return False
+
+
+def install_retool_dependencies(out=None, err=None) -> bool:
+    """
+    Install Retool dependencies (only those not already installed in this interpreter).
+    Progress goes to out/err (default: sys.stdout/sys.stderr), pip's output included.
+    """
+    out = sys.stdout if out is None else out
+    err = sys.stderr if err is None else err
+    
+    missing = [package for package in RETOOL_DEPENDENCIES if not is_package_installed(package)]
+    if not missing:
+        print(f"  ✅ All {len(RETOOL_DEPENDENCIES)} dependencies already present", file=out)
+        return True
+    
+    print(f"  📦 Installing {len(missing)} package(s)...", file=out)
     try:
         result = subprocess.run(
-            [sys.executable, "-m", "pip", "install"] + RETOOL_DEPENDENCIES,
+            [sys.executable, "-m", "pip", "install"] + PIP_QUIET_FLAGS + missing,
             capture_output=True,
             text=True,
             check=False
         )
         
+        out.write(result.stdout)
         if result.returncode == 0:
-            print(f"  ✅ Dependencies installed successfully")
+            print(f"  ✅ Dependencies installed successfully", file=out)
             return True
         else:
-            print(f"  ⚠️  Warning installing dependencies: {result.stderr}", file=sys.stderr)
+            print(f"  ⚠️  Warning installing dependencies: {result.stderr}", file=err)
             return True  # Continue anyway
     except Exception as e:
-        print(f"  ⚠️  Error installing dependencies: {e}", file=sys.stderr)
+        print(f"  ⚠️  Error installing dependencies: {e}", file=err)
         return True  # Continue anyway
 
 
@@ -217,42 +413,65 @@ def update_retool_clone_lists(retool_dir: Path) -> bool:
     if not retool_script.exists():
         print(f"  ⚠️  Retool script not found: {retool_script}")
         return True
+    cmd = [sys.executable, str(retool_script), "--update"]
     try:
-        # Don't capture output so it streams in real-time
-        result = subprocess.run(
-            [sys.executable, str(retool_script), "--update"],
+        # Stdout streams in real-time. Try without a stdin first so nothing can block on a prompt;
+        # stderr is echoed line by line while watching for the EOFError a prompt raises.
+        process = subprocess.Popen(
+            cmd,
             cwd=retool_dir,
-            input="y\ny\ny\n",
+            stdin=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            env={**os.environ, "CI": "1", "PYTHONUNBUFFERED": "1"},
             text=True,
-            check=False
+            errors="replace"
         )
+        hit_prompt = False
+        for line in process.stderr:
+            sys.stderr.write(line)
+            hit_prompt = hit_prompt or "EOFError" in line
+        returncode = process.wait()
         
-        if result.returncode == 0:
+        # Only rerun (answering the prompts) if it failed on a prompt, not e.g. on a network error
+        if returncode != 0 and hit_prompt:
+            print(f"  ℹ️  retool.py --update asked for input - rerunning with answers")
+            returncode = subprocess.run(
+                cmd,
+                cwd=retool_dir,
+                input="y\ny\ny\n",
+                text=True,
+                check=False
+            ).returncode
+        
+        if returncode == 0:
             return True
         else:
-            print(f"  ⚠️  Warning: retool.py --update exited with code {result.returncode}", file=sys.stderr)
+            print(f"  ⚠️  Warning: retool.py --update exited with code {returncode}", file=sys.stderr)
             return True  # Continue anyway
     except Exception as e:
         print(f"  ⚠️  Error updating clone lists: {e}", file=sys.stderr)
         return True  # Continue anyway
 
 
-def update_retool_main(retool_dir: Path) -> bool:
-    """Update retool directory using git pull."""
+def update_retool_main(retool_dir: Path, out=None, err=None) -> bool:
+    """Update retool directory using git pull. Progress goes to out/err (default: sys.stdout/sys.stderr)."""
+    out = sys.stdout if out is None else out
+    err = sys.stderr if err is None else err
+    
     if not (retool_dir / ".git").exists():
-        print(f"  ⚠️  Not a git repository, skipping update")
+        print(f"  ⚠️  Not a git repository, skipping update", file=out)
         return True
     
     # Check if git is available
     if not check_git_available():
-        print(f"  ⚠️  Git is not available, skipping Retool update")
+        print(f"  ⚠️  Git is not available, skipping Retool update", file=out)
         return True
     
-    print(f"  🔄 Checking for Retool updates...")
+    print(f"  🔄 Checking for Retool updates...", file=out)
     try:
         result = subprocess.run(
-            ["git", "pull"],
-            cwd=retool_dir,
+            ["git", "-C", str(retool_dir), "pull", "--ff-only", "--no-tags"],
+            env=GIT_NON_INTERACTIVE_ENV,
             capture_output=True,
             text=True,
             check=False
@@ -260,15 +479,15 @@ def update_retool_main(retool_dir: Path) -> bool:
         
         if result.returncode == 0:
             if "Already up to date" in result.stdout:
-                print(f"  ✅ Retool is already up to date")
+                print(f"  ✅ Retool is already up to date", file=out)
             else:
-                print(f"  ✅ Retool updated successfully")
+                print(f"  ✅ Retool updated successfully", file=out)
             return True
         else:
-            print(f"  ⚠️  Git pull warning: {result.stderr}", file=sys.stderr)
+            print(f"  ⚠️  Git pull warning: {result.stderr}", file=err)
             return True
     except Exception as e:
-        print(f"  ⚠️  Error updating retool: {e}", file=sys.stderr)
+        print(f"  ⚠️  Error updating retool: {e}", file=err)
         return True
 
 
@@ -277,17 +496,19 @@ def extract_zip_file(zip_path: Path, output_dir: Path) -> Path | None:
     print(f"  📂 Extracting archive...")
     try:
         with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-            dat_files = [f for f in zip_ref.namelist() if f.endswith('.dat')]
-            
-            if not dat_files:
-                print(f"  ❌ No .dat file found in archive", file=sys.stderr)
-                return None
+            # Stream only the first .dat member; nothing else in the archive touches disk
+            for info in zip_ref.infolist():
+                if not info.filename.endswith('.dat'):
+                    continue
+                
+                extracted_path = output_dir / Path(info.filename).name
+                with zip_ref.open(info) as src, open(extracted_path, 'wb') as dst:
+                    shutil.copyfileobj(src, dst, EXTRACT_CHUNK_SIZE)
+                print(f"  ✅ Extracted: {extracted_path.name}")
+                return extracted_path
             
-            dat_filename = dat_files[0]
-            zip_ref.extract(dat_filename, output_dir)
-            extracted_path = output_dir / dat_filename
-            print(f"  ✅ Extracted: {extracted_path.name}")
-            return extracted_path
+            print(f"  ❌ No .dat file found in archive", file=sys.stderr)
+            return None
             
     except zipfile.BadZipFile:
         print(f"  ❌ Invalid .zip file", file=sys.stderr)
@@ -297,8 +518,173 @@ def extract_zip_file(zip_path: Path, output_dir: Path) -> Path | None:
         return None
 
 
-def download_redump_psx_dat(output_dir: Path) -> Path | None:
-    """Download the latest Redump PlayStation 1 .dat file (may be .zip)."""
+def create_http_session() -> requests.Session:
+    """Create a keep-alive session with retries for talking to Redump.org."""
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=RANGED_DOWNLOAD_PARTS + 1,
+        max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[502, 503, 504]),
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers.update({
+        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
+        'Accept-Encoding': 'gzip, deflate',
+    })
+    return session
+
+
+HTTP_SESSION = create_http_session()
+
+
+def load_download_cache() -> dict:
+    """Load the validators (ETag/Last-Modified) saved from the last Redump download."""
+    try:
+        with open(DOWNLOAD_CACHE_PATH, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (FileNotFoundError, ValueError):
+        return {}
+
+
+def save_download_cache(response, output_path: Path) -> None:
+    """Save the validators from a successful Redump download next to the .dat files."""
+    cache = {
+        "etag": response.headers.get('ETag'),
+        "last_modified": response.headers.get('Last-Modified'),
+        "filename": output_path.name,
+        "size": output_path.stat().st_size,
+    }
+    try:
+        with open(DOWNLOAD_CACHE_PATH, 'w', encoding='utf-8') as f:
+            json.dump(cache, f, indent=2)
+    except Exception as e:
+        print(f"  ⚠️  Warning: Could not save download cache: {e}", file=sys.stderr)
+
+
+def preallocate_file(fd: int, size: int) -> None:
+    """Reserve disk space for a download up front where the platform supports it."""
+    if size <= 0 or not hasattr(os, "posix_fallocate"):
+        return
+    try:
+        os.posix_fallocate(fd, 0, size)
+    except OSError:
+        pass  # Filesystem doesn't support it - the writes will allocate as they go
+
+
+def stream_to_file(response, output_path: Path) -> None:
+    """
+    Stream a response body straight to disk instead of holding it all in memory.
+    A failed download is removed, so a preallocated, zero-padded file is never left behind.
+    """
+    try:
+        with open(output_path, 'wb') as f:
+            if not response.headers.get('Content-Encoding'):
+                preallocate_file(f.fileno(), int(response.headers.get('Content-Length', 0)))
+            for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                if chunk:
+                    f.write(chunk)
+            # Drop any preallocated space past what actually arrived
+            f.truncate()
+    except BaseException:
+        output_path.unlink(missing_ok=True)
+        raise
+
+
+def response_validator(response) -> str | None:
+    """Return the strong ETag or Last-Modified that identifies this exact version of the file, for If-Range."""
+    etag = response.headers.get('ETag')
+    if etag and not etag.startswith('W/'):
+        return etag
+    return response.headers.get('Last-Modified')
+
+
+def supports_ranged_download(response) -> bool:
+    """Check whether a response is large enough, advertises byte ranges on the raw body and has a validator."""
+    if not hasattr(os, "pwrite"):
+        return False
+    if response.headers.get('Accept-Ranges') != 'bytes' or response.headers.get('Content-Encoding'):
+        return False
+    if not response_validator(response):
+        return False
+    total_size = int(response.headers.get('Content-Length', 0))
+    return total_size >= RANGED_DOWNLOAD_MIN_SIZE
+
+
+def ranged_download(url: str, output_path: Path, response, parts: int = RANGED_DOWNLOAD_PARTS) -> bool:
+    """
+    Download a file as several byte ranges over parallel connections.
+    Every range is pinned to the version described by response (via If-Range), so parts of two
+    different files are never stitched together.
+    Returns False (removing the partial file) if any range fails, so the caller can fall back to a single stream.
+    """
+    total_size = int(response.headers['Content-Length'])
+    validator = response_validator(response)
+    part_size = -(-total_size // parts)
+    ranges = [(start, min(total_size, start + part_size) - 1) for start in range(0, total_size, part_size)]
+    
+    def fetch_range(byte_range: tuple[int, int]) -> bool:
+        start, end = byte_range
+        headers = {'Range': f'bytes={start}-{end}', 'If-Range': validator, 'Accept-Encoding': 'identity'}
+        with HTTP_SESSION.get(url, headers=headers, timeout=30, stream=True) as part:
+            # A 200 means If-Range failed: the file changed since the first response
+            if part.status_code != 206 or response_validator(part) != validator:
+                return False
+            if part.headers.get('Content-Range') != f'bytes {start}-{end}/{total_size}':
+                return False
+            offset = start
+            for chunk in part.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                os.pwrite(fd, chunk, offset)
+                offset += len(chunk)
+        return offset == end + 1
+    
+    succeeded = False
+    fd = os.open(output_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.ftruncate(fd, total_size)
+        preallocate_file(fd, total_size)
+        with ThreadPoolExecutor(max_workers=len(ranges)) as executor:
+            succeeded = all(executor.map(fetch_range, ranges))
+        if not succeeded:
+            print(f"  ⚠️  A range was refused or the file changed mid-download, retrying as a single stream", file=sys.stderr)
+    except Exception as e:
+        print(f"  ⚠️  Ranged download failed, retrying as a single stream: {e}", file=sys.stderr)
+    finally:
+        os.close(fd)
+    
+    if succeeded:
+        print(f"     Downloaded in {len(ranges)} parallel ranges")
+        return True
+    
+    output_path.unlink(missing_ok=True)
+    return False
+
+
+def response_filename(response) -> str:
+    """Get the download filename from Content-Disposition, or a dated default."""
+    # Message.get_filename() understands both filename= and RFC 5987 filename*=
+    disposition = Message()
+    disposition['Content-Disposition'] = response.headers.get('Content-Disposition', '')
+    filename = disposition.get_filename()
+    if not filename:
+        timestamp = datetime.now().strftime("%Y-%m-%d")
+        filename = f"Sony - PlayStation ({timestamp}) (Redump).zip"
+    return filename
+
+
+def print_download_summary(output_path: Path) -> None:
+    """Print the name and size of a finished download."""
+    file_size = output_path.stat().st_size
+    print(f"  ✅ Download successful!")
+    print(f"     File: {output_path.name}")
+    print(f"     Size: {file_size / 1024 / 1024:.2f} MB ({file_size:,} bytes)")
+
+
+def download_redump_psx_dat(output_dir: Path, use_cache: bool = True) -> Path | None:
+    """
+    Download the latest Redump PlayStation 1 .dat file (may be .zip).
+    With use_cache, an unchanged upstream file is reused instead of downloaded again.
+    """
     output_dir.mkdir(parents=True, exist_ok=True)
     dat_url = "http://redump.org/datfile/psx/"
     
@@ -306,30 +692,56 @@ def download_redump_psx_dat(output_dir: Path) -> Path | None:
     print(f"     URL: {dat_url}")
     
     try:
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        }
-        response = requests.get(dat_url, headers=headers, timeout=30)
-        response.raise_for_status()
-        
-        content_disposition = response.headers.get('Content-Disposition', '')
-        if 'filename=' in content_disposition:
-            filename = content_disposition.split('filename=')[1].strip('"\'')
+        headers = {}
+
+        # Only ask for a 304 if the previously downloaded file is still intact on disk
+        cache = load_download_cache() if use_cache else {}
+        cached_path = output_dir / cache["filename"] if cache.get("filename") else None
+        if cached_path and cached_path.exists() and cached_path.stat().st_size == cache.get("size"):
+            if cache.get("etag"):
+                headers['If-None-Match'] = cache["etag"]
+            if cache.get("last_modified"):
+                headers['If-Modified-Since'] = cache["last_modified"]
         else:
-            timestamp = datetime.now().strftime("%Y-%m-%d")
-            filename = f"Sony - PlayStation ({timestamp}) (Redump).zip"
-        
-        output_path = output_dir / filename
-        
-        print(f"  ⬇️  Downloading file...")
-        with open(output_path, 'wb') as f:
-            f.write(response.content)
+            cached_path = None
+
+        # Probe with HEAD first, so a ranged download doesn't hold an idle GET open alongside it
+        try:
+            head = HTTP_SESSION.head(dat_url, headers=headers, timeout=30, allow_redirects=True)
+        except requests.exceptions.RequestException:
+            head = None  # Some servers don't answer HEAD - the GET below covers everything
         
-        file_size = output_path.stat().st_size
-        print(f"  ✅ Download successful!")
-        print(f"     File: {output_path.name}")
-        print(f"     Size: {file_size / 1024 / 1024:.2f} MB ({file_size:,} bytes)")
+        if head is not None and head.status_code == 304 and cached_path:
+            print(f"  ✅ Redump .dat unchanged since last download")
+            print(f"     Reusing: {cached_path.name}")
+            return cached_path
         
+        ranged = head is not None and head.ok and supports_ranged_download(head)
+        if ranged:
+            output_path = output_dir / response_filename(head)
+            print(f"  ⬇️  Downloading file...")
+            if ranged_download(dat_url, output_path, head):
+                save_download_cache(head, output_path)
+                print_download_summary(output_path)
+                return output_path
+
+        # Single stream: the fallback, and the only path for servers without ranges
+        with HTTP_SESSION.get(dat_url, headers=headers, timeout=30, stream=True) as response:
+            if response.status_code == 304 and cached_path:
+                print(f"  ✅ Redump .dat unchanged since last download")
+                print(f"     Reusing: {cached_path.name}")
+                return cached_path
+
+            response.raise_for_status()
+
+            output_path = output_dir / response_filename(response)
+
+            if not ranged:
+                print(f"  ⬇️  Downloading file...")
+            stream_to_file(response, output_path)
+            save_download_cache(response, output_path)
+
+        print_download_summary(output_path)
         return output_path
         
     except requests.exceptions.RequestException as e:
@@ -340,6 +752,23 @@ def download_redump_psx_dat(output_dir: Path) -> Path | None:
         return None
 
 
+def find_new_dat_file(directory: Path, known: set[str]) -> Path | None:
+    """
+    Find the .dat Retool just wrote, using one directory scan.
+    Files are only stat-ed when there isn't exactly one new name, falling back to the most recently modified .dat.
+    """
+    with os.scandir(directory) as it:
+        dat_entries = [entry for entry in it if entry.name.endswith('.dat') and entry.is_file()]
+    
+    new_entries = [entry for entry in dat_entries if entry.name not in known]
+    if len(new_entries) == 1:
+        return Path(new_entries[0].path)
+    
+    # Ambiguous (or overwritten in place) - fall back to the most recently modified .dat
+    newest = max(dat_entries, key=lambda entry: entry.stat().st_mtime, default=None)
+    return Path(newest.path) if newest else None
+
+
 def run_retool(input_dat: Path, retool_dir: Path, output_dir: Path) -> Path | None:
     """Run Retool to filter the .dat file."""
     retool_script = retool_dir / "retool.py"
@@ -355,46 +784,194 @@ def run_retool(input_dat: Path, retool_dir: Path, output_dir: Path) -> Path | No
     ] + RETOOL_FLAGS + ["--exclude", "".join(RETOOL_EXCLUDE)] + ["--output", str(output_dir)]
     
     try:
-        # Don't capture output so it streams in real-time
+        # Snapshot existing .dat files so the new output can be found without stat-ing every file
+        with os.scandir(output_dir) as it:
+            existing_dats = {entry.name for entry in it if entry.name.endswith('.dat')}
+        
+        # Don't capture stdout so it streams in real-time; keep stderr for error reporting
         result = subprocess.run(
             cmd,
             cwd=retool_dir,
             input="y\ny\ny\n",
+            stderr=subprocess.PIPE,
             text=True,
             check=False
         )
         
         if result.returncode != 0:
             print(f"  ❌ Retool failed with exit code {result.returncode}", file=sys.stderr)
+            if result.stderr:
+                print(result.stderr, file=sys.stderr)
             return None
         
-        output_files = list(output_dir.glob("*.dat"))
+        output_dat = find_new_dat_file(output_dir, existing_dats)
         
-        if output_files:
-            output_file = max(output_files, key=lambda p: p.stat().st_mtime)
-            return output_file
-        else:
+        if not output_dat:
             print(f"  ⚠️  No output .dat file found in {output_dir}", file=sys.stderr)
-            return None
+        return output_dat
             
     except Exception as e:
         print(f"  ❌ Error running Retool: {e}", file=sys.stderr)
         return None
 
 
+def file_sha256(path: Path) -> str:
+    """Compute the SHA-256 of a file, reading it in 1 MiB blocks."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def get_retool_head(retool_dir: Path) -> str | None:
+    """Return the commit Retool is checked out at, or None if it cannot be determined."""
+    if not (retool_dir / ".git").exists() or not check_git_available():
+        return None
+    
+    try:
+        result = subprocess.run(
+            ["git", "-C", str(retool_dir), "rev-parse", "HEAD"],
+            env=GIT_NON_INTERACTIVE_ENV,
+            capture_output=True,
+            text=True,
+            check=False
+        )
+    except Exception:
+        return None
+    
+    return result.stdout.strip() if result.returncode == 0 else None
+
+
+def filter_cache_key(input_sha: str) -> str:
+    """
+    Build the filter cache key from everything that decides Retool's output:
+    the input .dat, flags, excludes, user config, Retool checkout and its clone lists.
+    """
+    digest = hashlib.sha256()
+    config_sha = file_sha256(USER_CONFIG_SOURCE) if USER_CONFIG_SOURCE.exists() else ""
+    for part in (input_sha, " ".join(RETOOL_FLAGS), "".join(RETOOL_EXCLUDE), config_sha, get_retool_head(RETOOL_DIR) or ""):
+        digest.update(part.encode("utf-8") + b"\0")
+    
+    for directory in RETOOL_CLONE_LIST_DIRS:
+        for path in sorted(p for p in directory.rglob("*") if p.is_file()):
+            digest.update(path.relative_to(RETOOL_DIR).as_posix().encode("utf-8") + b"\0")
+            digest.update(file_sha256(path).encode("ascii"))
+    
+    return digest.hexdigest()
+
+
+def find_cached_filter_output(filter_key: str) -> tuple[Path | None, Path | None]:
+    """
+    Look up the Retool output produced last time for this filter cache key.
+    Returns (output_dat_path, report_txt_path), or (None, None) if there is no usable cache.
+    """
+    try:
+        with open(FILTER_CACHE_PATH, 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+    except (FileNotFoundError, ValueError):
+        return None, None
+    
+    if cache.get("key") != filter_key or not cache.get("output"):
+        return None, None
+    
+    output_dat = DAT_DIR / cache["output"]
+    if not output_dat.exists():
+        return None, None
+    
+    report_txt = REPORTS_DIR / cache["report"] if cache.get("report") else None
+    if report_txt and not report_txt.exists():
+        report_txt = None
+    
+    return output_dat, report_txt
+
+
+def save_filter_cache(filter_key: str, output_dat: Path, report_txt: Path | None) -> None:
+    """Remember which Retool output (and report) was produced for a filter cache key."""
+    cache = {
+        "key": filter_key,
+        "output": output_dat.name,
+        "report": report_txt.name if report_txt else None,
+    }
+    try:
+        with open(FILTER_CACHE_PATH, 'w', encoding='utf-8') as f:
+            json.dump(cache, f, indent=2)
+    except Exception as e:
+        print(f"  ⚠️  Warning: Could not save filter cache: {e}", file=sys.stderr)
+
+
+def load_pipeline_state() -> dict:
+    """Load the steps recorded by an interrupted pipeline run, unless the run is too old to resume."""
+    try:
+        with open(PIPELINE_STATE_PATH, 'r', encoding='utf-8') as f:
+            state = json.load(f)
+    except (FileNotFoundError, ValueError):
+        return {}
+    
+    try:
+        started = datetime.fromisoformat(state["started"])
+    except (KeyError, TypeError, ValueError):
+        return {}
+    
+    age_hours = (datetime.now(timezone.utc) - started).total_seconds() / 3600
+    if age_hours > PIPELINE_STATE_MAX_AGE_HOURS:
+        print(f"  ⚠️  Interrupted run is {age_hours:.0f} hours old, starting over", file=sys.stderr)
+        return {}
+    
+    return state
+
+
+def record_pipeline_step(state: dict, step: str, path: Path, sha: str | None = None) -> None:
+    """Record the file produced by a completed pipeline step so a rerun can resume after it."""
+    state.setdefault("started", datetime.now(timezone.utc).isoformat())
+    state[step] = {"file": path.name, "sha": sha or file_sha256(path)}
+    try:
+        with open(PIPELINE_STATE_PATH, 'w', encoding='utf-8') as f:
+            json.dump(state, f, indent=2)
+    except Exception as e:
+        print(f"  ⚠️  Warning: Could not save pipeline state: {e}", file=sys.stderr)
+
+
+def resumable_step_file(state: dict, step: str, directory: Path) -> Path | None:
+    """Return the file recorded for a step if it still exists with the recorded hash."""
+    entry = state.get(step)
+    if not entry:
+        return None
+    
+    path = directory / entry["file"]
+    if not path.exists() or file_sha256(path) != entry["sha"]:
+        return None
+    
+    return path
+
+
+def clear_pipeline_state() -> None:
+    """Forget the recorded steps once the pipeline has completed."""
+    try:
+        PIPELINE_STATE_PATH.unlink()
+    except FileNotFoundError:
+        pass
+
+
 def cleanup_old_files(directory: Path, pattern: str, keep_count: int = 7) -> int:
     """Keep only the most recent files matching the pattern, delete older ones."""
-    if not directory.exists():
+    try:
+        with os.scandir(directory) as entries:
+            files = [
+                (entry.stat().st_mtime, Path(entry.path))
+                for entry in entries
+                if fnmatch.fnmatch(entry.name, pattern)
+            ]
+    except FileNotFoundError:
         return 0
     
-    files = list(directory.glob(pattern))
     if len(files) <= keep_count:
         return 0
     
-    files.sort(key=lambda p: p.stat().st_mtime, reverse=True)
+    files.sort(reverse=True)
     
     deleted_count = 0
-    for file_to_delete in files[keep_count:]:
+    for _, file_to_delete in files[keep_count:]:
         try:
             file_to_delete.unlink()
             deleted_count += 1
@@ -425,39 +1002,39 @@ def print_step(step_num: int, total_steps: int, description: str, emoji: str = "
     print("  " + "─" * 66)
 
 
-def run_dat_download_and_filter() -> tuple[Path | None, Path | None]:
+class TeeStream:
+    """Stream proxy that copies every write to several streams."""
+
+    def __init__(self, *streams):
+        self._streams = streams
+
+    def write(self, text: str) -> int:
+        for stream in self._streams:
+            stream.write(text)
+        return len(text)
+
+    def flush(self):
+        for stream in self._streams:
+            stream.flush()
+
+
+def run_concurrently(*calls: tuple) -> list[tuple[object, str, str]]:
     """
-    Run the DAT download and filtering process.
-    Returns (output_dat_path, report_txt_path) or (None, None) on failure.
+    Run (func, *args) calls in parallel threads, each writing to its own out/err buffers.
+    Returns (result, stdout, stderr) per call, in order, so output can be printed step by step.
     """
-    print_title("REDUMP DAT DOWNLOADER AND RETOOL FILTER", "📥")
-    
-    # Step 1: Download .dat/.zip file
-    print_step(1, 9, "Downloading Redump DAT file", "⬇️")
-    downloaded_file = download_redump_psx_dat(DAT_DIR)
-    if not downloaded_file:
-        print("\n  ❌ Download failed!")
-        return None, None
-    
-    # Step 2: Extract if it's a .zip file
-    print_step(2, 9, "Extracting DAT file", "📂")
-    input_dat = downloaded_file
-    extracted_dat = None
-    if downloaded_file.suffix.lower() == '.zip':
-        extracted_dat = extract_zip_file(downloaded_file, DAT_DIR)
-        if not extracted_dat:
-            print("\n  ❌ Extraction failed!")
-            return None, None
-        input_dat = extracted_dat
-        # Delete the .zip file after extraction
-        try:
-            downloaded_file.unlink()
-            print("  🗑️  Deleted intermediate .zip file")
-        except Exception as e:
-            print(f"  ⚠️  Warning: Could not delete .zip file: {e}")
-    else:
-        print("  ℹ️  File is already a .dat file, skipping extraction")
+    def captured(func, *args):
+        out, err = io.StringIO(), io.StringIO()
+        result = func(*args, out=out, err=err)
+        return result, out.getvalue(), err.getvalue()
     
+    with ThreadPoolExecutor(max_workers=len(calls)) as executor:
+        futures = [executor.submit(captured, *call) for call in calls]
+        return [future.result() for future in futures]
+
+
+def prepare_retool() -> None:
+    """Set up and update Retool, its config and its clone lists (steps 3-7)."""
     # Step 3: Clone Retool if needed
     print_step(3, 9, "Setting up Retool", "🔧")
     if not clone_retool_if_needed(RETOOL_DIR):
@@ -468,19 +1045,47 @@ def run_dat_download_and_filter() -> tuple[Path | None, Path | None]:
     if not copy_user_config():
         print("  ⚠️  Continuing despite config copy issues...")
     
+    # Steps 5 & 6 are independent, so install dependencies and git pull concurrently
+    (deps_ok, deps_out, deps_err), (update_ok, update_out, update_err) = run_concurrently(
+        (install_retool_dependencies,),
+        (update_retool_main, RETOOL_DIR),
+    )
+    
     # Step 5: Install dependencies
     print_step(5, 9, "Installing Python dependencies", "📦")
-    if not install_retool_dependencies():
+    print(deps_out, end="")
+    print(deps_err, end="", file=sys.stderr)
+    if not deps_ok:
         print("  ⚠️  Continuing despite dependency installation issues...")
     
     # Step 6: Update retool via git pull
     print_step(6, 9, "Updating Retool repository", "🔄")
-    if not update_retool_main(RETOOL_DIR):
+    print(update_out, end="")
+    print(update_err, end="", file=sys.stderr)
+    if not update_ok:
         print("  ⚠️  Continuing despite retool update issues...")
     
-    # Step 7: Update Retool clone lists & Filter DAT file (combined)
+    # Step 7: Update Retool clone lists (filtering follows unless the cached output still applies)
     print_step(7, 9, "Updating Retool & Filtering DAT file", "📥")
-    print(f"  🔍 Downloading clone lists and metadata files and processing DAT with Retool...")
+    print(f"  🔍 Downloading clone lists and metadata files...")
+    print()
+    print("═" * 70)
+    print("  📢 Raw Retool Output - START")
+    print("═" * 70)
+    
+    if not update_retool_clone_lists(RETOOL_DIR):
+        print("  ⚠️  Continuing despite clone list update issues...")
+    
+    print()
+    print("═" * 70)
+    print("  📢 Raw Retool Output - END")
+    print("═" * 70)
+    print()
+
+
+def filter_dat_with_retool(input_dat: Path) -> Path | None:
+    """Filter the .dat with the prepared Retool (rest of step 7). Returns the filtered .dat path."""
+    print(f"  🔍 Processing DAT with Retool...")
     print(f"     Input file: {input_dat.name}")
     print(f"     Flags: {' '.join(RETOOL_FLAGS)}")
     print(f"     Exclude: {''.join(RETOOL_EXCLUDE)}")
@@ -490,9 +1095,6 @@ def run_dat_download_and_filter() -> tuple[Path | None, Path | None]:
     print("  📢 Raw Retool Output - START")
     print("═" * 70)
     
-    if not update_retool_clone_lists(RETOOL_DIR):
-        print("  ⚠️  Continuing despite clone list update issues...")
-    
     output_dat = run_retool(input_dat, RETOOL_DIR, DAT_DIR)
     
     print()
@@ -503,11 +1105,97 @@ def run_dat_download_and_filter() -> tuple[Path | None, Path | None]:
     
     if not output_dat:
         print("  ❌ Retool processing failed!")
-        return None, None
+        return None
     
     print(f"  ✅ Retool processing complete!")
     print(f"     Output: {output_dat.name}")
     
+    return output_dat
+
+
+def run_dat_download_and_filter(force: bool = False) -> tuple[Path | None, Path | None]:
+    """
+    Run the DAT download and filtering process.
+    Steps completed by an interrupted previous run are reused unless force is set.
+    Returns (output_dat_path, report_txt_path) or (None, None) on failure.
+    """
+    print_title("REDUMP DAT DOWNLOADER AND RETOOL FILTER", "📥")
+    
+    state = {} if force else load_pipeline_state()
+    if state:
+        print("  ♻️  Resuming interrupted run (use --force to start over)")
+    
+    # Step 1: Download .dat/.zip file
+    print_step(1, 9, "Downloading Redump DAT file", "⬇️")
+    downloaded_file = resumable_step_file(state, "download", DAT_DIR)
+    if downloaded_file:
+        print(f"  ♻️  Reusing download from interrupted run: {downloaded_file.name}")
+    else:
+        downloaded_file = download_redump_psx_dat(DAT_DIR, use_cache=not force)
+        if not downloaded_file:
+            print("\n  ❌ Download failed!")
+            return None, None
+        record_pipeline_step(state, "download", downloaded_file)
+    
+    # Step 2: Extract if it's a .zip file
+    print_step(2, 9, "Extracting DAT file", "📂")
+    input_dat = downloaded_file
+    extracted_dat = None
+    resumed_dat = resumable_step_file(state, "extract", DAT_DIR)
+    if resumed_dat:
+        print(f"  ♻️  Reusing extracted .dat from interrupted run: {resumed_dat.name}")
+        input_dat = resumed_dat
+        if resumed_dat != downloaded_file:
+            extracted_dat = resumed_dat
+    elif downloaded_file.suffix.lower() == '.zip':
+        extracted_dat = extract_zip_file(downloaded_file, DAT_DIR)
+        if not extracted_dat:
+            print("\n  ❌ Extraction failed!")
+            return None, None
+        input_dat = extracted_dat
+        # Keep only the latest .zip so an unchanged upstream file can be reused next run
+        deleted_zips = cleanup_old_files(DAT_DIR, "*.zip", keep_count=1)
+        if deleted_zips > 0:
+            print(f"  🗑️  Deleted {deleted_zips} old .zip file(s)")
+    else:
+        print("  ℹ️  File is already a .dat file, skipping extraction")
+    
+    if resumed_dat:
+        input_sha = state["extract"]["sha"]
+    else:
+        input_sha = file_sha256(input_dat)
+        record_pipeline_step(state, "extract", input_dat, input_sha)
+    
+    # Steps 3-7: Set up Retool and filter the .dat
+    output_dat = resumable_step_file(state, "retool", DAT_DIR)
+    if output_dat:
+        print(f"\n  ♻️  Reusing Retool output from interrupted run: {output_dat.name}")
+        filter_key = filter_cache_key(input_sha)
+    else:
+        # Retool and its clone lists are always brought up to date, so the cache key reflects them
+        prepare_retool()
+        filter_key = filter_cache_key(input_sha)
+        
+        # Skip filtering if this exact .dat was already filtered with the same Retool setup
+        cached_output, cached_report = (None, None) if force else find_cached_filter_output(filter_key)
+        if cached_output:
+            print(f"  ✅ Redump .dat and Retool setup unchanged since last filter run - skipping filtering")
+            print(f"     Reusing: {cached_output.name}")
+            if input_dat != cached_output:
+                try:
+                    input_dat.unlink()
+                    print("  🗑️  Deleted intermediate .dat file")
+                except Exception as e:
+                    print(f"  ⚠️  Warning: Could not delete intermediate .dat file: {e}")
+            clear_pipeline_state()
+            print()
+            return cached_output, cached_report
+        
+        output_dat = filter_dat_with_retool(input_dat)
+        if not output_dat:
+            return None, None
+        record_pipeline_step(state, "retool", output_dat)
+    
     # Step 8a: Delete intermediate .dat file immediately after Retool finishes
     # (the extracted Redump .dat, not the filtered output)
     if extracted_dat and extracted_dat != output_dat and extracted_dat.exists():
@@ -542,6 +1230,10 @@ def run_dat_download_and_filter() -> tuple[Path | None, Path | None]:
                 print(f"  ⚠️  Warning: Could not move {report_file.name}: {e}")
     else:
         print("  ℹ️  No report files to move")
+        report_txt_path = resumable_step_file(state, "report", REPORTS_DIR)
+    
+    if report_txt_path:
+        record_pipeline_step(state, "report", report_txt_path)
     
     # Step 9: Clean up old files (keep only last 7)
     print_step(9, 9, "Cleaning up old files", "🧹")
@@ -561,6 +1253,9 @@ def run_dat_download_and_filter() -> tuple[Path | None, Path | None]:
         remaining = len(list(REPORTS_DIR.glob("*.txt")))
         print(f"  ✅ No old report files to delete (keeping {remaining} file{'s' if remaining != 1 else ''})")
     
+    save_filter_cache(filter_key, output_dat, report_txt_path)
+    clear_pipeline_state()
+    
     # Summary
     print_title("✅ DAT PROCESSING COMPLETE", "✅")
     print(f"  📁 Final filtered .dat:")
@@ -579,43 +1274,121 @@ def run_dat_download_and_filter() -> tuple[Path | None, Path | None]:
 # ============================================================================
 
 def extract_revision(name: str) -> tuple[str, int | None]:
-    """Extract revision number from a game name."""
-    match = re.search(r'\(Rev (\d+)\)', name, re.IGNORECASE)
-    if match:
-        rev_num = int(match.group(1))
-        name_without_rev = re.sub(r'\s*\(Rev \d+\)', '', name, flags=re.IGNORECASE).strip()
-        return (name_without_rev, rev_num)
-    return (name.strip(), None)
+    """Extract revision number from a game name (the first (Rev N) tag); every such tag is stripped."""
+    rev_num = None
+    pieces = []
+    pos = 0
+    start = name.find("(")
+    while start != -1:
+        if name[start + 1:start + 5].lower() == "rev ":
+            digits_start = start + 5
+            end = digits_start
+            while end < len(name) and name[end].isdecimal():
+                end += 1
+            if end > digits_start and name[end:end + 1] == ")":
+                if rev_num is None:
+                    rev_num = int(name[digits_start:end])
+                pieces.append(name[pos:start].rstrip())
+                pos = end + 1
+                start = name.find("(", pos)
+                continue
+        start = name.find("(", start + 1)
+    
+    if rev_num is None:
+        return (name.strip(), None)
+    
+    pieces.append(name[pos:])
+    return ("".join(pieces).strip(), rev_num)
+
+
+def iter_dat_game_names(dat_path: Path):
+    """Stream the (unescaped) game names out of a Redump .dat without building the whole tree."""
+    if LXML_AVAILABLE:
+        context = ET.iterparse(str(dat_path), events=("end",), tag="game")
+    else:
+        # The first "start" event hands us the root so finished games can be detached from it
+        context = ET.iterparse(dat_path, events=("start", "end"))
+    
+    root = None
+    for event, elem in context:
+        if root is None:
+            root = elem
+        if event != "end" or elem.tag != "game":
+            continue
+        
+        game_name = elem.get('name')
+        
+        # Free each game once read so memory stays flat regardless of .dat size
+        elem.clear()
+        if LXML_AVAILABLE:
+            while elem.getprevious() is not None:
+                del elem.getparent()[0]
+        else:
+            root.clear()
+        
+        if game_name:
+            yield html.unescape(game_name)
+
+
+def dat_signature(dat_path: Path) -> list:
+    """Identify a .dat file by path, modification time and size."""
+    stat = dat_path.stat()
+    return [str(dat_path.resolve()), stat.st_mtime_ns, stat.st_size]
+
+
+def load_dat_parse_cache(dat_path: Path) -> set[str] | None:
+    """Return the names parsed last time if the .dat is unchanged, else None."""
+    try:
+        with open(DAT_PARSE_CACHE_PATH, 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+        if cache.get("signature") != dat_signature(dat_path):
+            return None
+        return set(cache["names"])
+    except (OSError, ValueError, KeyError):
+        return None
+
+
+def save_dat_parse_cache(dat_path: Path, dat_names: set[str]) -> None:
+    """Save the parsed names, keyed by the .dat signature."""
+    cache = {
+        "signature": dat_signature(dat_path),
+        "names": sorted(dat_names),
+    }
+    try:
+        with open(DAT_PARSE_CACHE_PATH, 'w', encoding='utf-8') as f:
+            json.dump(cache, f)
+    except Exception as e:
+        print(f"  ⚠️  Warning: Could not save .dat parse cache: {e}", file=sys.stderr)
+
+
+def read_dat_game_names(dat_path: Path) -> set[str]:
+    """Read all game names from the .dat, reusing the parse cache while the file is unchanged."""
+    dat_names = load_dat_parse_cache(dat_path)
+    if dat_names is None:
+        dat_names = set(iter_dat_game_names(dat_path))
+        save_dat_parse_cache(dat_path, dat_names)
+    return dat_names
 
 
 def parse_dat_file_for_revisions(dat_path: Path) -> dict[str, int]:
     """Parse the Redump .dat XML file and create a mapping from base name to highest revision."""
-    base_to_max_rev = defaultdict(int)
+    base_to_max_rev = {}
     
     try:
-        tree = ET.parse(dat_path)
-        root = tree.getroot()
-        
-        for game in root.findall('game'):
-            game_name = game.get('name')
-            if game_name:
-                game_name = html.unescape(game_name)
-                base_name, rev_num = extract_revision(game_name)
-                
-                if rev_num is not None:
-                    if rev_num > base_to_max_rev[base_name]:
-                        base_to_max_rev[base_name] = rev_num
-                else:
-                    if base_name not in base_to_max_rev:
-                        base_to_max_rev[base_name] = 0
+        for game_name in read_dat_game_names(dat_path):
+            base_name, rev_num = extract_revision(game_name)
+            
+            rev_num = rev_num or 0
+            if rev_num > base_to_max_rev.get(base_name, -1):
+                base_to_max_rev[base_name] = rev_num
         
-        return dict(base_to_max_rev)
+        return base_to_max_rev
         
     except ET.ParseError as e:
-        print(f"ERROR: Failed to parse .dat file for revisions: {e}")
+        print(f"  ❌ ERROR: Failed to parse .dat file for revisions: {e}", file=sys.stderr)
         return {}
     except Exception as e:
-        print(f"ERROR: {e}")
+        print(f"  ❌ ERROR: {e}", file=sys.stderr)
         return {}
 
 
@@ -637,18 +1410,8 @@ def parse_dat_file(dat_path: Path) -> set[str]:
     """Parse the Redump .dat XML file and extract all game names."""
     print(f"  📄 Parsing .dat file: {dat_path.name}")
     
-    dat_names = set()
-    
     try:
-        tree = ET.parse(dat_path)
-        root = tree.getroot()
-        
-        for game in root.findall('game'):
-            game_name = game.get('name')
-            if game_name:
-                game_name = html.unescape(game_name)
-                dat_names.add(game_name)
-        
+        dat_names = read_dat_game_names(dat_path)
         print(f"     Found {len(dat_names)} game names")
         return dat_names
         
@@ -660,81 +1423,83 @@ def parse_dat_file(dat_path: Path) -> set[str]:
         return set()
 
 
+def png_entries(directory: Path) -> dict[str, os.DirEntry]:
+    """Return {stem: DirEntry} for the .png files in a directory, scanning it only once per run."""
+    stems = DIR_ENTRIES_CACHE.get(directory)
+    if stems is None:
+        stems = {}
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.name.endswith(".png") and entry.is_file():
+                        stems[entry.name[:-4]] = entry
+        except FileNotFoundError:
+            pass
+        DIR_ENTRIES_CACHE[directory] = stems
+    return stems
+
+
+def scan_all_directories() -> dict[Path, dict[str, os.DirEntry]]:
+    """Scan every collection directory up front (in parallel) so all later checks share one listing."""
+    directories = [
+        directory
+        for dirs in COLLECTION_DIRS.values()
+        for directory in dirs
+        if directory not in DIR_ENTRIES_CACHE
+    ]
+    if directories:
+        with ThreadPoolExecutor(max_workers=len(directories)) as executor:
+            list(executor.map(png_entries, directories))
+    return DIR_ENTRIES_CACHE
+
+
+def collection_index() -> dict[str, dict[str, dict[str, os.DirEntry]]]:
+    """Map each category to {location: {stem: DirEntry}}, built from the cached directory scans."""
+    return {
+        category: {location: png_entries(directory) for directory, location in dirs}
+        for category, dirs in CATEGORY_DIRS.items()
+    }
+
+
 def collect_collection_filenames() -> set[str]:
     """Collect all unique filenames (stems) from collection directories."""
     print(f"  📂 Collecting collection filenames...")
     
     collection_names = set()
+    for locations in collection_index().values():
+        for stems in locations.values():
+            collection_names.update(stems)
     
-    for category, dirs in COLLECTION_DIRS.items():
-        for directory in dirs:
-            if not directory.exists():
-                continue
-            
-            for file_path in directory.glob("*.png"):
-                if " alt" in file_path.stem:
-                    continue
-                
-                collection_names.add(file_path.stem)
+    collection_names = {name for name in collection_names if " alt" not in name}
     
     print(f"     Found {len(collection_names)} unique collection filenames")
     return collection_names
 
 
-def check_image_exists(game_name: str, category: str) -> tuple[bool, str]:
-    """Check if an image exists for a game in a specific category."""
-    if category == "2dbox":
-        dirs = [
-            (LIBRARY_DIR / "2dbox", "normal"),
-            (LIBRARY_DIR / "2dbox-lq", "lq"),
-            (LIBRARY_DIR / "2dbox-missing", "missing"),
-        ]
-    elif category == "3dbox":
-        dirs = [
-            (LIBRARY_DIR / "3dbox", "normal"),
-            (LIBRARY_DIR / "3dbox-lq", "lq"),
-            (LIBRARY_DIR / "3dbox-missing", "missing"),
-        ]
-    elif category == "disc":
-        dirs = [
-            (LIBRARY_DIR / "disc", "normal"),
-            (LIBRARY_DIR / "disc-lq", "lq"),
-            (LIBRARY_DIR / "disc-missing", "missing"),
-        ]
-    elif category == "psp-icon0":
-        # Single directory - check if file exists
-        file_path = PSP_ICON0_DIR / f"{game_name}.png"
-        if file_path.exists():
-            return (True, "psp-icon0")
-        return (False, None)
-    else:
-        return (False, None)
-    
-    for directory, location in dirs:
-        if directory.exists():
-            file_path = directory / f"{game_name}.png"
-            if file_path.exists():
-                return (True, location)
-    
-    return (False, None)
-
-
-def check_collection_completeness(collection_names: set[str]) -> tuple[dict, dict]:
-    """Check that every game has 2dbox, 3dbox, disc, and psp-icon0 images."""
+def check_collection_status(collection_names: set[str]) -> tuple[dict, dict, dict]:
+    """
+    Check image completeness and cross-folder duplicates in a single pass.
+    Returns (missing_images, missing_only_games, duplicates).
+    """
     missing_images = {}
     missing_only_games = {}
+    duplicates = {category: [] for category in COLLECTION_DIRS}
+    index = collection_index()
     
     for game_name in collection_names:
         missing_cats = []
         missing_only_cats = []
-
-        for category in ["2dbox", "3dbox", "disc", "psp-icon0"]:
-            exists, location = check_image_exists(game_name, category)
+        
+        for category, stems_by_location in index.items():
+            locations = [location for location, stems in stems_by_location.items() if game_name in stems]
             
-            if not exists:
+            if not locations:
                 missing_cats.append(category)
-            elif location == "missing":
+            elif locations[0] == "missing":
                 missing_only_cats.append(category)
+            
+            if len(locations) > 1:
+                duplicates[category].append((game_name, locations))
         
         if missing_cats:
             missing_images[game_name] = missing_cats
@@ -742,72 +1507,46 @@ def check_collection_completeness(collection_names: set[str]) -> tuple[dict, dic
         if missing_only_cats:
             missing_only_games[game_name] = missing_only_cats
     
-    return missing_images, missing_only_games
-
-
-def check_missing_folder_duplicates(collection_names: set[str]) -> dict:
-    """Check if files exist in multiple folders for the same image type."""
-    duplicates = {
-        "2dbox": [],
-        "3dbox": [],
-        "disc": [],
-        "psp-icon0": [],
-    }
-
-    for category in ["2dbox", "3dbox", "disc", "psp-icon0"]:
-        for game_name in collection_names:
-            locations = []
-
-            if category == "psp-icon0":
-                # Single directory - no duplicates possible
-                psp_dir = COLLECTION_DIRS[category][0]
-                if psp_dir.exists():
-                    psp_file = psp_dir / f"{game_name}.png"
-                    if psp_file.exists():
-                        locations.append("psp-icon0")
-            else:
-                normal_dir = COLLECTION_DIRS[category][0]
-                lq_dir = COLLECTION_DIRS[category][1]
-                missing_dir = COLLECTION_DIRS[category][2]
-
-                if normal_dir.exists():
-                    normal_file = normal_dir / f"{game_name}.png"
-                    if normal_file.exists():
-                        locations.append("normal")
+    return missing_images, missing_only_games, duplicates
 
-                if lq_dir.exists():
-                    lq_file = lq_dir / f"{game_name}.png"
-                    if lq_file.exists():
-                        locations.append("lq")
 
-                if missing_dir.exists():
-                    missing_file = missing_dir / f"{game_name}.png"
-                    if missing_file.exists():
-                        locations.append("missing")
-
-            if len(locations) > 1:
-                duplicates[category].append((game_name, locations))
+def check_psp_icon0_sync(index: dict[str, dict[str, dict[str, os.DirEntry]]]) -> list[Path]:
+    """
+    Check for files in psp-icon0 directory that don't match any library game.
+    psp-icon0 stems are part of the collection names themselves, so compare against the library categories instead.
+    """
+    library_names = set()
+    for category, locations in index.items():
+        if category == "psp-icon0":
+            continue
+        for stems in locations.values():
+            library_names.update(stem for stem in stems if " alt" not in stem)
     
-    return duplicates
-
-
-def check_psp_icon0_sync(collection_names: set[str]) -> list[Path]:
-    """Check for files in psp-icon0 directory that don't match any collection name."""
-    mismatched_files = []
+    orphan_stems = index["psp-icon0"]["psp-icon0"].keys() - library_names
+    return [PSP_ICON0_DIR / f"{game_name}.png" for game_name in orphan_stems]
 
-    if not PSP_ICON0_DIR.exists():
-        return mismatched_files
 
-    for file_path in PSP_ICON0_DIR.glob("*.png"):
-        game_name = file_path.stem
-        if game_name not in collection_names:
-            mismatched_files.append(file_path)
+def iter_png_entries(directory: Path):
+    """Yield the cached os.DirEntry objects for the non-alt .png files in a directory."""
+    for stem, entry in png_entries(directory).items():
+        if " alt" not in stem:
+            yield entry
 
-    return mismatched_files
 
-
-def get_image_dimensions(image_path: Path) -> tuple[int, int] | None:
-    """Get the dimensions (width, height) of an image file."""
+def get_image_dimensions(image_path: Path | str) -> tuple[int, int] | None:
+    """
+    Get the dimensions (width, height) of an image file.
+    PNGs are read straight from the IHDR header; anything else falls back to Pillow.
+    """
+    try:
+        with open(image_path, "rb") as f:
+            header = f.read(24)
+    except OSError:
+        return None
+    
+    if len(header) == 24 and header[:8] == PNG_SIGNATURE and header[12:16] == b"IHDR":
+        return struct.unpack(">II", header[16:24])
+    
     if not PIL_AVAILABLE:
         return None
     
@@ -818,130 +1557,118 @@ def get_image_dimensions(image_path: Path) -> tuple[int, int] | None:
         return None
 
 
-def is_perfect_dimension(category: str, width: int, height: int) -> bool:
-    """Check if dimensions match 'Perfect' standards for the category."""
-    if category == "2dbox":
-        return width == 1200 and height == 1200
-    elif category == "3dbox":
-        if width == 1325 and height == 1200:
-            return True
-        if width == 1227 and height == 1200:
-            return True
-        if width == 1273 and height == 1200:
-            return True
-    elif category == "disc":
-        return width == 696 and height == 694
-    return False
+def load_dimension_cache() -> dict:
+    """Load the image dimensions recorded by the last run, keyed by path."""
+    try:
+        with open(DIMENSION_CACHE_PATH, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (FileNotFoundError, ValueError):
+        return {}
+
+
+def save_dimension_cache(cache: dict) -> None:
+    """Save {path: [mtime_ns, size, width, height]} so unchanged images are not re-read next run."""
+    try:
+        with open(DIMENSION_CACHE_PATH, 'w', encoding='utf-8') as f:
+            json.dump(cache, f)
+    except Exception as e:
+        print(f"  ⚠️  Warning: Could not save dimension cache: {e}", file=sys.stderr)
 
 
 def analyze_image_dimensions(collection_names: set[str]) -> dict:
     """Analyze image dimensions for 2dbox, 3dbox, disc, and psp-icon0 categories."""
-    if not PIL_AVAILABLE:
-        return {
-            "error": "PIL/Pillow not available - cannot analyze dimensions"
-        }
-    
     results = {
         "2dbox": {
-            "normal": {"dimensions": defaultdict(int), "vertical": [], "total": 0},
-            "lq": {"dimensions": defaultdict(int), "vertical": [], "total": 0},
-            "missing": {"dimensions": defaultdict(int), "vertical": [], "total": 0},
+            "normal": {"dimensions": Counter(), "vertical": [], "total": 0},
+            "lq": {"dimensions": Counter(), "vertical": [], "total": 0},
+            "missing": {"dimensions": Counter(), "vertical": [], "total": 0},
         },
         "3dbox": {
-            "normal": {"dimensions": defaultdict(int), "total": 0},
-            "lq": {"dimensions": defaultdict(int), "total": 0},
-            "missing": {"dimensions": defaultdict(int), "total": 0},
+            "normal": {"dimensions": Counter(), "total": 0},
+            "lq": {"dimensions": Counter(), "total": 0},
+            "missing": {"dimensions": Counter(), "total": 0},
         },
         "disc": {
-            "normal": {"dimensions": defaultdict(int), "total": 0},
-            "lq": {"dimensions": defaultdict(int), "total": 0},
-            "missing": {"dimensions": defaultdict(int), "total": 0},
+            "normal": {"dimensions": Counter(), "total": 0},
+            "lq": {"dimensions": Counter(), "total": 0},
+            "missing": {"dimensions": Counter(), "total": 0},
         },
         "psp-icon0": {
-            "psp-icon0": {"dimensions": defaultdict(int), "total": 0},
+            "psp-icon0": {"dimensions": Counter(), "total": 0},
         },
     }
 
-    for category in ["2dbox", "3dbox", "disc", "psp-icon0"]:
-        dirs = COLLECTION_DIRS[category]
-        
-        for directory in dirs:
-            if not directory.exists():
-                continue
-            
-            dir_name = directory.name
-            if category == "psp-icon0":
-                # Single directory
-                dir_type = "psp-icon0"
-                for file_path in directory.glob("*.png"):
-                    game_name = file_path.stem
-                    
-                    if " alt" in game_name:
-                        continue
-                    
-                    dimensions = get_image_dimensions(file_path)
-                    if dimensions:
-                        width, height = dimensions
-                        results[category][dir_type]["dimensions"][(width, height)] += 1
-                        results[category][dir_type]["total"] += 1
-            else:
-                if dir_name == category:
-                    dir_type = "normal"
-                elif dir_name == f"{category}-lq":
-                    dir_type = "lq"
-                elif dir_name == f"{category}-missing":
-                    dir_type = "missing"
-                else:
+    # Gather every file first; only files changed since the last run need their header read
+    cache = load_dimension_cache()
+    tasks = []
+    for category, dirs in CATEGORY_DIRS.items():
+        for directory, dir_type in dirs:
+            for entry in iter_png_entries(directory):
+                try:
+                    stat = entry.stat()
+                except OSError:
                     continue
                 
-                for file_path in directory.glob("*.png"):
-                    game_name = file_path.stem
-                    
-                    if " alt" in game_name:
-                        continue
-                    
-                    dimensions = get_image_dimensions(file_path)
-                    if dimensions:
-                        width, height = dimensions
-                        results[category][dir_type]["dimensions"][(width, height)] += 1
-                        results[category][dir_type]["total"] += 1
-                        
-                        if category == "2dbox" and height > width:
-                            height_percentage = ((height - width) / width) * 100
-                            if height_percentage > 3.0:
-                                results[category][dir_type]["vertical"].append((game_name, width, height))
+                key = [stat.st_mtime_ns, stat.st_size]
+                cached = cache.get(entry.path)
+                dimensions = tuple(cached[2:]) if cached and cached[:2] == key else None
+                tasks.append((category, dir_type, entry.name[:-4], entry.path, key, dimensions))
+    
+    pending = [task[3] for task in tasks if task[5] is None]
+    with ThreadPoolExecutor(max_workers=IMAGE_SCAN_WORKERS) as executor:
+        read_dimensions = dict(zip(pending, executor.map(get_image_dimensions, pending)))
+    
+    new_cache = {}
+    bucket_dimensions = {}
+    for category, dir_type, game_name, path, key, dimensions in tasks:
+        if dimensions is None:
+            dimensions = read_dimensions[path]
+        if not dimensions:
+            continue
+        
+        new_cache[path] = key + list(dimensions)
+        bucket_dimensions.setdefault((category, dir_type), []).append(dimensions)
+        
+        width, height = dimensions
+        if category == "2dbox" and height > width:
+            height_percentage = ((height - width) / width) * 100
+            if height_percentage > 3.0:
+                results[category][dir_type]["vertical"].append((game_name, width, height))
+    
+    # Counter.update() on a list does the tallying in C
+    for (category, dir_type), dimensions in bucket_dimensions.items():
+        results[category][dir_type]["dimensions"].update(dimensions)
+        results[category][dir_type]["total"] = len(dimensions)
+    
+    if new_cache != cache:
+        save_dimension_cache(new_cache)
     
     return results
 
 
-def find_latest_dat_file(dat_dir: Path) -> Path | None:
-    """Find the latest .dat file in the specified directory."""
-    if not dat_dir.exists():
-        return None
-    
-    dat_files = list(dat_dir.glob("*.dat"))
-    
-    if not dat_files:
+def find_latest_file(directory: Path, suffix: str) -> Path | None:
+    """Find the most recently modified file ending in suffix, in one scandir pass. Directories are ignored."""
+    try:
+        with os.scandir(directory) as it:
+            latest = max(
+                (entry for entry in it if entry.name.endswith(suffix) and entry.is_file()),
+                key=lambda entry: entry.stat().st_mtime,
+                default=None,
+            )
+    except OSError:
         return None
     
-    dat_files.sort(key=lambda p: p.stat().st_mtime, reverse=True)
-    
-    return dat_files[0]
+    return Path(latest.path) if latest else None
+
+
+def find_latest_dat_file(dat_dir: Path) -> Path | None:
+    """Find the latest .dat file in the specified directory."""
+    return find_latest_file(dat_dir, ".dat")
 
 
 def find_latest_txt_file(reports_dir: Path) -> Path | None:
     """Find the latest .txt file in the reports directory."""
-    if not reports_dir.exists():
-        return None
-    
-    txt_files = list(reports_dir.glob("*.txt"))
-    
-    if not txt_files:
-        return None
-    
-    txt_files.sort(key=lambda p: p.stat().st_mtime, reverse=True)
-    
-    return txt_files[0]
+    return find_latest_file(reports_dir, ".txt")
 
 
 def parse_filter_report(txt_path: Path) -> dict[str, str]:
@@ -953,65 +1680,35 @@ def parse_filter_report(txt_path: Path) -> dict[str, str]:
     current_parent = None
     
     try:
-        with open(txt_path, 'r', encoding='utf-8') as f:
-            for line in f:
-                line = line.rstrip()
-                
-                if line == "TITLES WITH CLONES":
-                    current_section = "Clone"
-                    current_parent = None
-                    continue
-                elif line == "APPLICATION REMOVES":
-                    current_section = "Application"
-                    current_parent = None
-                    continue
-                elif line == "AUDIO REMOVES":
-                    current_section = "Audio"
-                    current_parent = None
-                    continue
-                elif line == "COVERDISC REMOVES":
-                    current_section = "Coverdisc"
-                    current_parent = None
-                    continue
-                elif line == "DEMO, KIOSK, AND SAMPLE REMOVES":
-                    current_section = "Demo/Kiosk/Sample"
-                    current_parent = None
-                    continue
-                elif line == "EDUCATIONAL REMOVES":
-                    current_section = "Educational"
-                    current_parent = None
-                    continue
-                elif line == "UNLICENSED REMOVES":
-                    current_section = "Unlicensed"
-                    current_parent = None
-                    continue
-                elif line == "VIDEO REMOVES":
-                    current_section = "Video"
-                    current_parent = None
-                    continue
-                elif line == "LANGUAGE REMOVES":
-                    current_section = "Language"
-                    current_parent = None
-                    continue
-                
-                if not line or line.startswith("=") or line.startswith("*") or line.startswith("SECTIONS") or line.startswith("This file"):
-                    continue
-                
-                stripped_line = line.lstrip()
-                if stripped_line.startswith("+ "):
-                    if current_section == "Clone":
-                        current_parent = stripped_line[2:].strip()
-                    continue
+        lines = txt_path.read_text(encoding='utf-8').splitlines()
+        
+        for line in lines:
+            line = line.rstrip()
+            
+            section = FILTER_REPORT_SECTIONS.get(line)
+            if section is not None:
+                current_section = section
+                current_parent = None
+                continue
+            
+            if not line or line.startswith(FILTER_REPORT_SKIP_PREFIXES):
+                continue
+            
+            stripped_line = line.lstrip()
+            if stripped_line.startswith("+ "):
+                if current_section == "Clone":
+                    current_parent = stripped_line[2:].strip()
+                continue
+            
+            if stripped_line.startswith("- "):
+                game_name = stripped_line[2:].strip()
                 
-                if stripped_line.startswith("- "):
-                    game_name = stripped_line[2:].strip()
-                    
-                    if current_section == "Clone" and current_parent:
-                        removed_games[game_name] = f"Superior version: '{current_parent}'"
-                    elif current_section:
-                        removed_games[game_name] = current_section
-                    else:
-                        removed_games[game_name] = "Removed"
+                if current_section == "Clone" and current_parent:
+                    removed_games[game_name] = f"Superior version: '{current_parent}'"
+                elif current_section:
+                    removed_games[game_name] = current_section
+                else:
+                    removed_games[game_name] = "Removed"
         
         print(f"     Found {len(removed_games)} removed games")
         return removed_games
@@ -1035,8 +1732,11 @@ def print_header(title: str):
     print()
 
 
-def generate_collection_report(dat_file: Path, txt_file: Path | None = None) -> None:
-    """Generate the full collection report."""
+def generate_collection_report(dat_file: Path, txt_file: Path | None = None) -> tuple[set[str], set[str]] | None:
+    """
+    Generate the full collection report.
+    Returns (dat names, collection names) for reuse, or None if the report could not be built.
+    """
     print_title("COLLECTION vs .DAT FILE REPORT", "📊")
     
     print(f"  Using .dat file: {dat_file.name}")
@@ -1054,7 +1754,7 @@ def generate_collection_report(dat_file: Path, txt_file: Path | None = None) ->
     if not dat_names:
         print()
         print("  ❌ ERROR: No game names found in .dat file. Cannot proceed.")
-        return
+        return None
     
     # Collect collection filenames
     collection_names = collect_collection_filenames()
@@ -1062,21 +1762,21 @@ def generate_collection_report(dat_file: Path, txt_file: Path | None = None) ->
     if not collection_names:
         print()
         print("  ❌ ERROR: No collection filenames found. Cannot proceed.")
-        return
+        return None
     
     # Compare
     print()
     print(f"  🔍 Comparing collection to .dat file...")
     
-    in_dat_not_collection = sorted(dat_names - collection_names)
-    in_collection_not_dat = sorted(collection_names - dat_names)
-    in_both = sorted(collection_names & dat_names)
+    in_dat_not_collection = dat_names - collection_names
+    in_collection_not_dat = collection_names - dat_names
+    in_both_count = len(collection_names & dat_names)
     
     # Report results
     print_title("SUMMARY", "📈")
     print(f"  Total games in .dat file:        {len(dat_names):>6}")
     print(f"  Total games in collection:       {len(collection_names):>6}")
-    print(f"  Games in both:                   {len(in_both):>6}")
+    print(f"  Games in both:                   {in_both_count:>6}")
     print(f"  Games in .dat not in collection: {len(in_dat_not_collection):>6}")
     print(f"  Games in collection not in .dat: {len(in_collection_not_dat):>6}")
     print()
@@ -1084,7 +1784,7 @@ def generate_collection_report(dat_file: Path, txt_file: Path | None = None) ->
     # Check collection completeness
     print()
     print(f"  🔍 Checking collection completeness...")
-    missing_images, missing_only_games = check_collection_completeness(collection_names)
+    missing_images, missing_only_games, missing_duplicates = check_collection_status(collection_names)
     
     print_title("COLLECTION COMPLETENESS CHECK", "✅")
     print("  Every game should have 4 images: 2dbox, 3dbox, disc, and psp-icon0")
@@ -1100,11 +1800,13 @@ def generate_collection_report(dat_file: Path, txt_file: Path | None = None) ->
             print(f"  ⚠️ Games genuinely missing images ({len(missing_images)} games):")
             print("  (No file exists in normal, -lq, or -missing folders)")
             print()
+            lines = []
             for game_name in sorted(missing_images.keys()):
                 missing_cats = missing_images[game_name]
                 missing_str = ", ".join(missing_cats)
-                print(f"    ❌ {game_name}")
-                print(f"       Genuinely missing: {missing_str}")
+                lines.append(f"    ❌ {game_name}")
+                lines.append(f"       Genuinely missing: {missing_str}")
+            print("\n".join(lines))
             print()
         else:
             print("  ✅ All games have all 4 required images!")
@@ -1114,11 +1816,13 @@ def generate_collection_report(dat_file: Path, txt_file: Path | None = None) ->
             print(f"  ℹ️  Games with acknowledged missing images ({len(missing_only_games)} games):")
             print("  (Blank template exists in -missing folder)")
             print()
+            lines = []
             for game_name in sorted(missing_only_games.keys()):
                 missing_only_cats = missing_only_games[game_name]
                 missing_only_str = ", ".join(missing_only_cats)
-                print(f"    📍 {game_name}")
-                print(f"       Acknowledged missing: {missing_only_str} (blank template exists in -missing folder)")
+                lines.append(f"    📍 {game_name}")
+                lines.append(f"       Acknowledged missing: {missing_only_str} (blank template exists in -missing folder)")
+            print("\n".join(lines))
             print()
         else:
             print("  ✅ No games have acknowledged missing images!")
@@ -1127,7 +1831,6 @@ def generate_collection_report(dat_file: Path, txt_file: Path | None = None) ->
     # Check for duplicate files across folders
     print()
     print(f"  🔍 Checking for duplicate files across folders...")
-    missing_duplicates = check_missing_folder_duplicates(collection_names)
     
     has_duplicates = any(missing_duplicates[cat] for cat in ["2dbox", "3dbox", "disc"])
     
@@ -1142,10 +1845,12 @@ def generate_collection_report(dat_file: Path, txt_file: Path | None = None) ->
                 cat_display = category.upper()
                 print(f"  {cat_display} ({len(missing_duplicates[category])} files):")
                 print()
+                lines = []
                 for game_name, locations in sorted(missing_duplicates[category]):
                     locations_str = ", ".join(locations)
-                    print(f"    ⚠️ {game_name}")
-                    print(f"       Exists in: {locations_str}")
+                    lines.append(f"    ⚠️ {game_name}")
+                    lines.append(f"       Exists in: {locations_str}")
+                print("\n".join(lines))
                 print()
     else:
         print_title("DUPLICATE FILES ACROSS FOLDERS", "✅")
@@ -1155,17 +1860,20 @@ def generate_collection_report(dat_file: Path, txt_file: Path | None = None) ->
     # Check for mismatched files in psp-icon0 directories
     print()
     print(f"  🔍 Checking psp-icon0 sync...")
-    mismatched_psp = check_psp_icon0_sync(collection_names)
+    mismatched_psp = check_psp_icon0_sync(collection_index())
 
     if mismatched_psp:
         print_title("PSP-ICON0 SYNC CHECK", "⚠️")
         print("  Files in psp-icon0 directories that don't match any collection name:")
         print()
 
+        # Every mismatched file lives in psp-icon0, so resolve the relative directory once
+        relative_dir = PSP_ICON0_DIR.relative_to(SCRIPT_DIR.parent.parent)
+        lines = []
         for file_path in sorted(mismatched_psp):
-            relative_path = file_path.relative_to(SCRIPT_DIR.parent)
-            print(f"    ⚠️ {file_path.stem}")
-            print(f"       Path: {relative_path}")
+            lines.append(f"    ⚠️ {file_path.stem}")
+            lines.append(f"       Path: {relative_dir / file_path.name}")
+        print("\n".join(lines))
         print()
     else:
         print_title("PSP-ICON0 SYNC CHECK", "✅")
@@ -1179,104 +1887,66 @@ def generate_collection_report(dat_file: Path, txt_file: Path | None = None) ->
     
     print_title("IMAGE DIMENSION ANALYSIS", "📐")
     
-    if "error" in dimension_results:
-        print(f"  ⚠️ {dimension_results['error']}")
-        print("  Install Pillow to enable dimension analysis: pip install Pillow")
-        print()
-    else:
-        for category in ["2dbox", "3dbox", "disc", "psp-icon0"]:
-            cat_data = dimension_results[category]
-
-            if category == "2dbox":
-                cat_display = "2DBox"
-                cat_emoji = "📦"
-            elif category == "3dbox":
-                cat_display = "3DBox"
-                cat_emoji = "📦"
-            elif category == "disc":
-                cat_display = "Disc"
-                cat_emoji = "💿"
-            else:
-                cat_display = "PSP-Icon0"
-                cat_emoji = "🎮"
+    for category in ["2dbox", "3dbox", "disc", "psp-icon0"]:
+        cat_data = dimension_results[category]
+        cat_emoji, cat_display = CATEGORY_DISPLAY[category]
+        
+        print(f"\n  {cat_emoji} {cat_display}")
+        print("  " + "─" * 66)
+        
+        for directory, dir_type in CATEGORY_DIRS[category]:
+            # -missing folders only hold blank templates, so they are left out of the table
+            if dir_type == "missing":
+                continue
+
+            dir_data = cat_data[dir_type]
+            total = dir_data["total"]
             
-            print(f"\n  {cat_emoji} {cat_display}")
-            print("  " + "─" * 66)
+            print(f"\n  {DIR_DISPLAY[directory]}")
             
-            if category == "psp-icon0":
-                dir_types = ["psp-icon0"]
-                dir_indices = [0]
-            else:
-                dir_types = ["normal", "lq"]
-                dir_indices = [0, 1]
-
-            for dir_type, dir_index in zip(dir_types, dir_indices):
-                if dir_type not in cat_data:
-                    continue
-
-                dir_data = cat_data[dir_type]
-                total = dir_data["total"]
-
-                directory = COLLECTION_DIRS[category][dir_index]
-                
-                try:
-                    # Use workspace root (parent.parent) for relative paths
-                    rel_path = directory.relative_to(SCRIPT_DIR.parent.parent)
-                    dir_path_display = str(rel_path).replace("/", "\\") + "\\"
-                except ValueError:
-                    # Fallback: just use the directory name if relative path fails
-                    dir_path_display = directory.name + "\\"
-                
-                print(f"\n  {dir_path_display}")
-                
-                if total == 0:
-                    print("    (no images)")
-                    continue
-                
-                dims = dir_data["dimensions"]
-                if dims:
-                    sorted_dims = sorted(dims.items(), key=lambda x: x[1], reverse=True)
-
-                    rows = []
-                    for (width, height), count in sorted_dims:
-                        is_perfect = is_perfect_dimension(category, width, height)
-                        is_square = width == height
-
-                        if is_perfect:
-                            emoji = "⭐"
-                        elif is_square:
-                            emoji = "🟦"
-                        else:
-                            emoji = "⚪"
-
-                        dim_str = f"{width}x{height}"
-                        rows.append((emoji, dim_str, count))
-
-                    max_dim_len = max(len(dim_str) for _, dim_str, _ in rows)
-                    max_count_len = max(len(str(count)) for _, _, count in rows)
-
-                    for emoji, dim_str, count in rows:
-                        print(
-                            f"  {emoji}    {dim_str:<{max_dim_len}}  {count:>{max_count_len}}"
-                        )
-
-                if category == "2dbox" and dir_type in ["normal", "lq"] and dir_data["vertical"]:
-                    print(f"\n      ⚠️ Vertical 2dboxes found ({len(dir_data['vertical'])} images):")
-                    print("      (Height > Width - these should be horizontal/landscape)")
-                    for game_name, width, height in sorted(dir_data["vertical"]):
-                        print(f"        📐 {game_name}: {width}x{height}")
-                elif category == "2dbox" and dir_type in ["normal", "lq"]:
-                    print("\n      ✅ No vertical 2dboxes found (all are horizontal/landscape)")
-        
-        print()
+            if total == 0:
+                print("    (no images)")
+                continue
+            
+            dims = dir_data["dimensions"]
+            if dims:
+                sorted_dims = dims.most_common()
+
+                perfect_dims = PERFECT_DIMENSIONS.get(category, frozenset())
+                rows = []
+                for (width, height), count in sorted_dims:
+                    is_perfect = (width, height) in perfect_dims
+                    emoji = DIMENSION_EMOJI[(is_perfect, width == height)]
+
+                    dim_str = f"{width}x{height}"
+                    rows.append((emoji, dim_str, count))
+
+                max_dim_len = max(len(dim_str) for _, dim_str, _ in rows)
+                max_count_len = len(str(sorted_dims[0][1]))
+
+                print("\n".join(
+                    f"  {emoji}    {dim_str:<{max_dim_len}}  {count:>{max_count_len}}"
+                    for emoji, dim_str, count in rows
+                ))
+
+            if category == "2dbox" and dir_type in ["normal", "lq"] and dir_data["vertical"]:
+                print(f"\n      ⚠️ Vertical 2dboxes found ({len(dir_data['vertical'])} images):")
+                print("      (Height > Width - these should be horizontal/landscape)")
+                print("\n".join(
+                    f"        📐 {game_name}: {width}x{height}"
+                    for game_name, width, height in sorted(dir_data["vertical"])
+                ))
+            elif category == "2dbox" and dir_type in ["normal", "lq"]:
+                print("\n      ✅ No vertical 2dboxes found (all are horizontal/landscape)")
     
+    print()
+
     # Report games in .dat not in collection
     if in_dat_not_collection:
         print_title(f"GAMES IN .DAT NOT IN COLLECTION ({len(in_dat_not_collection)} games)", "📋")
         print("  These games exist in the .dat file but are missing from your collection:")
         print()
-        for name in in_dat_not_collection:
-            print(f"  📋 {name}")
+        print("\n".join(f"  📋 {name}" for name in sorted(in_dat_not_collection)))
         print()
     else:
         print_title("GAMES IN .DAT NOT IN COLLECTION", "✅")
@@ -1289,49 +1959,38 @@ def generate_collection_report(dat_file: Path, txt_file: Path | None = None) ->
         print("  These games exist in your collection but are not in the .dat file:")
         print()
         
+        sorted_not_in_dat = sorted(in_collection_not_dat)
+        
         if removal_reasons:
             games_with_reasons = []
             games_without_reasons = []
             
-            for name in in_collection_not_dat:
-                if name in removal_reasons:
-                    games_with_reasons.append((name, removal_reasons[name]))
+            for name in sorted_not_in_dat:
+                reason = removal_reasons.get(name)
+                if reason is not None:
+                    games_with_reasons.append((name, reason))
                 else:
                     games_without_reasons.append(name)
             
             if games_with_reasons:
-                for name, reason in sorted(games_with_reasons):
-                    emoji = "🔄"
+                lines = []
+                # Built from sorted_not_in_dat, so no re-sort is needed
+                for name, reason in games_with_reasons:
                     if reason.startswith("Superior version"):
                         emoji = "⭐"
-                    elif reason == "Language":
-                        emoji = "🌐"
-                    elif reason == "Demo/Kiosk/Sample":
-                        emoji = "🎮"
-                    elif reason == "Application":
-                        emoji = "💾"
-                    elif reason == "Audio":
-                        emoji = "🎵"
-                    elif reason == "Coverdisc":
-                        emoji = "📰"
-                    elif reason == "Educational":
-                        emoji = "📚"
-                    elif reason == "Unlicensed":
-                        emoji = "⚠️"
-                    elif reason == "Video":
-                        emoji = "🎬"
+                    else:
+                        emoji = REASON_EMOJI.get(reason, "🔄")
                     
-                    print(f"  {emoji} {name} → {reason}")
+                    lines.append(f"  {emoji} {name} → {reason}")
+                print("\n".join(lines))
                 print()
             
             if games_without_reasons:
                 print("  Games without removal reason in filter report:")
-                for name in sorted(games_without_reasons):
-                    print(f"  ❓ {name}")
+                print("\n".join(f"  ❓ {name}" for name in games_without_reasons))
                 print()
         else:
-            for name in in_collection_not_dat:
-                print(f"  ❓ {name}")
+            print("\n".join(f"  ❓ {name}" for name in sorted_not_in_dat))
             print()
     else:
         print_title("GAMES IN COLLECTION NOT IN .DAT", "✅")
@@ -1345,12 +2004,15 @@ def generate_collection_report(dat_file: Path, txt_file: Path | None = None) ->
     else:
         print("  ✅ Collection perfectly matches .dat file!")
     print()
+    
+    return dat_names, collection_names
 
 
-def run_collection_report(dat_file: Path | None = None, txt_file: Path | None = None) -> None:
+def run_collection_report(dat_file: Path | None = None, txt_file: Path | None = None) -> tuple[set[str], set[str]] | None:
     """
     Run the collection report generation.
     If dat_file or txt_file are not provided, finds the latest files.
+    Returns (dat names, collection names), or None if no report was generated.
     """
     # Find latest .dat file if not provided
     if dat_file is None:
@@ -1361,7 +2023,7 @@ def run_collection_report(dat_file: Path | None = None, txt_file: Path | None =
         if not dat_file:
             print()
             print(f"  ❌ ERROR: No .dat files found in {DAT_DIR}")
-            return
+            return None
         
         print(f"     Using latest .dat file: {dat_file.name}")
     
@@ -1376,8 +2038,11 @@ def run_collection_report(dat_file: Path | None = None, txt_file: Path | None =
         else:
             print(f"     ⚠️  No .txt file found - removal reasons will not be available")
     
+    # List the collection directories once; every check in the report reuses it
+    scan_all_directories()
+    
     # Generate the report
-    generate_collection_report(dat_file, txt_file)
+    return generate_collection_report(dat_file, txt_file)
 
 
 # ============================================================================
@@ -1386,35 +2051,15 @@ def run_collection_report(dat_file: Path | None = None, txt_file: Path | None =
 
 def count_hq_images(category: str, collection_names: set[str]) -> int:
     """Count high-quality images (not in -lq directories) for a category."""
-    hq_count = 0
-    
-    if category == "2dbox":
-        hq_dir = LIBRARY_DIR / "2dbox"
-    elif category == "3dbox":
-        hq_dir = LIBRARY_DIR / "3dbox"
-    elif category == "disc":
-        hq_dir = LIBRARY_DIR / "disc"
-    else:
-        return 0
-    
-    if not hq_dir.exists():
+    if category not in ("2dbox", "3dbox", "disc"):
         return 0
     
-    for game_name in collection_names:
-        file_path = hq_dir / f"{game_name}.png"
-        if file_path.exists():
-            hq_count += 1
-    
-    return hq_count
+    return len(collection_names & png_entries(LIBRARY_DIR / category).keys())
 
 
-def update_readme_progress(dat_file: Path, collection_names: set[str]) -> bool:
+def update_readme_progress(total_games: int, collection_names: set[str]) -> bool:
     """Update README.md with progress bar images for HQ images."""
     try:
-        # Count total games from DAT
-        dat_names = parse_dat_file(dat_file)
-        total_games = len(dat_names)
-        
         # Count HQ images for each category
         hq_2dbox = count_hq_images("2dbox", collection_names)
         hq_3dbox = count_hq_images("3dbox", collection_names)
@@ -1426,38 +2071,30 @@ def update_readme_progress(dat_file: Path, collection_names: set[str]) -> bool:
         percentage_disc = int((hq_disc / total_games) * 100) if total_games > 0 else 0
         
         # Read current README
-        if not README_MD_PATH.exists():
+        try:
+            readme_content = README_MD_PATH.read_text(encoding='utf-8')
+        except FileNotFoundError:
             print(f"  ⚠️  README.md not found: {README_MD_PATH}", file=sys.stderr)
             return False
         
-        with open(README_MD_PATH, 'r', encoding='utf-8') as f:
-            readme_content = f.read()
-        
-        # Replace progress bar URLs
-        import re
-        # Match and replace 2D progress bar (flexible whitespace)
-        pattern_2d = r'<img src="https://progress-bar\.xyz/\d+/\?title=2D&style=for-the-badge&width=100"\s*/>'
-        replacement_2d = f'<img src="https://progress-bar.xyz/{percentage_2d}/?title=2D&style=for-the-badge&width=100" />'
-        readme_content = re.sub(pattern_2d, replacement_2d, readme_content)
-        
-        # Match and replace 3D progress bar (flexible whitespace)
-        pattern_3d = r'<img src="https://progress-bar\.xyz/\d+/\?title=3D&style=for-the-badge&width=100"\s*/>'
-        replacement_3d = f'<img src="https://progress-bar.xyz/{percentage_3d}/?title=3D&style=for-the-badge&width=100" />'
-        readme_content = re.sub(pattern_3d, replacement_3d, readme_content)
-        
-        # Match and replace Disc progress bar (flexible whitespace)
-        pattern_disc = r'<img src="https://progress-bar\.xyz/\d+/\?title=Disc&style=for-the-badge&width=100"\s*/>'
-        replacement_disc = f'<img src="https://progress-bar.xyz/{percentage_disc}/?title=Disc&style=for-the-badge&width=100" />'
-        readme_content = re.sub(pattern_disc, replacement_disc, readme_content)
-        
-        # Write updated README
-        with open(README_MD_PATH, 'w', encoding='utf-8') as f:
-            f.write(readme_content)
+        # Replace all three progress bar URLs in a single pass
+        percentages = {"2D": percentage_2d, "3D": percentage_3d, "Disc": percentage_disc}
+        updated_content = PROGRESS_BAR_PATTERN.sub(
+            lambda m: f'<img src="https://progress-bar.xyz/{percentages[m.group(1)]}/?title={m.group(1)}&style=for-the-badge&width=100" />',
+            readme_content,
+        )
         
-        print(f"  ✅ Progress bars updated in README.md")
-        print(f"     2D Box: {percentage_2d}% ({hq_2dbox}/{total_games})")
-        print(f"     3D Box: {percentage_3d}% ({hq_3dbox}/{total_games})")
-        print(f"     Disc: {percentage_disc}% ({hq_disc}/{total_games})")
+        # Only rewrite the README when a percentage actually changed
+        if updated_content == readme_content:
+            print(f"  ✅ Progress bars in README.md already up to date")
+        else:
+            README_MD_PATH.write_text(updated_content, encoding='utf-8')
+            print(f"  ✅ Progress bars updated in README.md")
+        print(
+            f"     2D Box: {percentage_2d}% ({hq_2dbox}/{total_games})\n"
+            f"     3D Box: {percentage_3d}% ({hq_3dbox}/{total_games})\n"
+            f"     Disc: {percentage_disc}% ({hq_disc}/{total_games})"
+        )
         return True
         
     except Exception as e:
@@ -1465,34 +2102,58 @@ def update_readme_progress(dat_file: Path, collection_names: set[str]) -> bool:
         return False
 
 
-def write_completion_md(report_content: str, description: str = None) -> bool:
-    """Write the report to COMPLETION.md with proper formatting."""
+@contextmanager
+def completion_md_writer(description: str = None):
+    """
+    Stream the report into a temporary file next to COMPLETION.md, yielding the open file.
+    COMPLETION.md is only replaced once the report finishes; on failure the old file is kept.
+    Yields None if the file cannot be written.
+    """
     if description is None:
         description = "This completion report is updated weekly via automated full verification. It contains the most recent completion status."
     
+    tmp_path = COMPLETION_MD_PATH.with_name(COMPLETION_MD_PATH.name + ".tmp")
     try:
-        timestamp = datetime.utcnow().strftime("%Y-%m-%d %H:%M:%S UTC")
-        
-        with open(COMPLETION_MD_PATH, 'w', encoding='utf-8') as f:
-            f.write(f"{description}\n\n")
-            f.write(f"**Last Updated:** {timestamp}\n\n")
-            f.write("```\n")
-            f.write("\n")
-            f.write(report_content)
-            f.write("\n```\n")
-        
-        print(f"  ✅ Report written to COMPLETION.md")
-        return True
-        
+        timestamp = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S UTC")
+        f = open(tmp_path, 'w', encoding='utf-8')
+        f.write(f"{description}\n\n**Last Updated:** {timestamp}\n\n```\n\n")
     except Exception as e:
         print(f"  ⚠️  Warning: Could not write to COMPLETION.md: {e}", file=sys.stderr)
-        return False
+        yield None
+        return
+    
+    try:
+        yield f
+    except BaseException:
+        f.close()
+        tmp_path.unlink(missing_ok=True)
+        raise
+    
+    try:
+        f.write("\n```\n")
+        f.close()
+        os.replace(tmp_path, COMPLETION_MD_PATH)
+    except OSError as e:
+        f.close()
+        tmp_path.unlink(missing_ok=True)
+        print(f"  ⚠️  Warning: Could not write to COMPLETION.md: {e}", file=sys.stderr)
+        return
+    
+    print(f"  ✅ Report written to COMPLETION.md")
 
 
 def main():
     """Main entry point - runs both DAT download/filter and collection report."""
+    parser = argparse.ArgumentParser(description="Download and filter the Redump .dat, then report on the collection.")
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="ignore cached downloads, cached Retool output and interrupted-run state",
+    )
+    args = parser.parse_args()
+    
     # Part 1: Download and filter DAT file
-    output_dat, report_txt = run_dat_download_and_filter()
+    output_dat, report_txt = run_dat_download_and_filter(force=args.force)
     
     if not output_dat:
         print("\n  ❌ DAT download and filtering failed!")
@@ -1500,40 +2161,25 @@ def main():
         sys.exit(1)
     
     # Part 2: Generate collection report
-    # Capture report output
-    report_buffer = io.StringIO()
+    # Stream report output to the console and COMPLETION.md as it is produced
     original_stdout = sys.stdout
     
-    try:
-        # Redirect stdout to buffer during report generation
-        sys.stdout = report_buffer
-        run_collection_report(output_dat, report_txt)
-        sys.stdout = original_stdout
-        
-        # Get the report content
-        report_content = report_buffer.getvalue()
-        
-        # Print report to console
-        print(report_content)
-        
-        # Write to COMPLETION.md
-        write_completion_md(
-            report_content,
-            "This completion report is updated weekly via automated full verification. It contains the most recent completion status."
-        )
-        
-        # Update README.md with progress bars
-        # Get collection names for progress calculation
-        collection_names = collect_collection_filenames()
-        if collection_names:
-            update_readme_progress(output_dat, collection_names)
-        
-        print_title("✅ VERIFICATION COMPLETE", "✨")
-        
-    finally:
-        # Restore stdout
-        sys.stdout = original_stdout
-        report_buffer.close()
+    with completion_md_writer(
+        "This completion report is updated weekly via automated full verification. It contains the most recent completion status."
+    ) as completion_file:
+        if completion_file:
+            sys.stdout = TeeStream(original_stdout, completion_file)
+        try:
+            report_names = run_collection_report(output_dat, report_txt)
+        finally:
+            sys.stdout = original_stdout
+    
+    # Update README.md with progress bars, reusing the names the report already gathered
+    if report_names:
+        dat_names, collection_names = report_names
+        update_readme_progress(len(dat_names), collection_names)
+    
+    print_title("✅ VERIFICATION COMPLETE", "✨")
 
 
 if __name__ == "__main__":